@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 import typing as tp
 
 from plumbum import local
@@ -10,6 +11,11 @@ from benchbuild.environments.domain import model
 from benchbuild.settings import CFG
 from benchbuild.utils.cmd import buildah, mktemp
 
+# Changing the working directory affects the whole process. Layers that need
+# to run inside the build context may not overlap, if images are built in
+# parallel.
+_CWD_LOCK = threading.Lock()
+
 
 def bb_buildah(*args: str) -> BaseCommand:
     opts = [
@@ -44,7 +50,7 @@ def commit_working_container(container: model.Container) -> None:
 
 
 def spawn_add_layer(container: model.Container, layer: model.AddLayer) -> None:
-    with local.cwd(container.context):
+    with _CWD_LOCK, local.cwd(container.context):
         sources = [
             os.path.join(container.context, source) for source in layer.sources
         ]
@@ -73,7 +79,7 @@ def spawn_run_layer(container: model.Container, layer: model.RunLayer) -> None:
 def spawn_in_context(
     container: model.Container, layer: model.ContextLayer
 ) -> None:
-    with local.cwd(container.context):
+    with _CWD_LOCK, local.cwd(container.context):
         layer.func()
 
 
@@ -1,26 +1,79 @@
+import contextlib
+import fcntl
+import functools
 import logging
 import os
 import typing as tp
 
-from plumbum import local
+from plumbum import ProcessExecutionError
 from plumbum.commands.base import BaseCommand
 
+from benchbuild import utils
 from benchbuild.settings import CFG
-from benchbuild.utils.cmd import podman, rm
+from benchbuild.utils.cmd import podman, skopeo
 
 LOG = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _podman_base(root: str, runroot: str, transient_store: bool) -> BaseCommand:
+    opts = ['--root', root, '--runroot', runroot]
+    if transient_store:
+        opts.append('--transient-store')
+    return podman[opts]
+
+
 def bb_podman(*args: str) -> BaseCommand:
-    opts = [
-        '--root',
-        os.path.abspath(str(CFG['container']['root'])), '--runroot',
-        os.path.abspath(str(CFG['container']['runroot']))
-    ]
-    cmd = podman[opts]
+    cmd = _podman_base(
+        os.path.abspath(str(CFG['container']['root'])),
+        os.path.abspath(str(CFG['container']['runroot'])),
+        bool(CFG['container']['transient_store'])
+    )
     return cmd[args]
 
 
+@contextlib.contextmanager
+def _podman_cs_lock() -> tp.Iterator[None]:
+    """
+    Serialize podman commands that write to podman's container database.
+
+    Concurrent writers fail with 'database is locked' errors, unless podman
+    keeps its database in the runroot (CFG['container']['transient_store']).
+    The lock is shared between all benchbuild processes of this user. It
+    lives in XDG_RUNTIME_DIR or, if that is unset, in a per-user file in /tmp.
+    """
+    if CFG['container']['transient_store']:
+        yield
+        return
+
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        lock_path = os.path.join(runtime_dir, 'benchbuild-podman.lock')
+    else:
+        lock_path = f'/tmp/benchbuild-podman-{os.getuid()}.lock'
+
+    # flock does not need write access.
+    lock_fd = os.open(lock_path, os.O_RDONLY | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+    finally:
+        os.close(lock_fd)
+
+
+def _cfg_mount_args() -> tp.Tuple[str, ...]:
+    """
+    Mount specifications for all mounts configured in CFG['container'].
+    """
+    return tuple(
+        f'type=bind,src={source},target={target}'
+        for source, target in CFG['container']['mounts'].value
+    )
+
+
 def create_container(
     image_id: str,
     container_name: str,
@@ -37,31 +90,98 @@ def create_container(
         container_name: The name the container will be given.
         mounts: A list of mount specifications for the OCI runtime.
     """
-    podman_create = bb_podman('create', '--replace')
+    args: tp.List[str] = []
+    for mount in mounts or []:
+        args.extend(('--mount', mount))
+    for mount in _cfg_mount_args():
+        args.extend(('--mount', mount))
+
+    podman_create = bb_podman(
+        'create', '--replace', *args, '--name', container_name, image_id
+    )
+    # With '--replace' podman may print the id of the removed container
+    # first, the new container id is always on the last line.
+    with _podman_cs_lock():
+        output = str(podman_create())
+    container_id = output.strip().rpartition('\n')[2]
 
-    if mounts:
-        for mount in mounts:
-            create_cmd = podman_create['--mount', mount]
+    LOG.debug('created container: %s', container_id)
+    return container_id
 
-    cfg_mounts = list(CFG['container']['mounts'].value)
-    if cfg_mounts:
-        for source, target in cfg_mounts:
-            create_cmd = create_cmd['--mount',
-                                    f'type=bind,src={source},target={target}']
 
-    container_id = str(create_cmd('--name', container_name, image_id)).strip()
+def _has_skopeo() -> bool:
+    return not isinstance(skopeo, utils.ErrorCommand)
+
+
+def _qualified_name(image: str) -> str:
+    """
+    Qualify a short image name the way buildah stores it.
+
+    buildah commits short names (e.g., 'benchbuild:alpine') as
+    'localhost/benchbuild:alpine', whereas skopeo would resolve them against
+    docker.io.
+    """
+    domain, sep, _ = image.partition('/')
+    if sep and ('.' in domain or ':' in domain or domain == 'localhost'):
+        return image
+    return f'localhost/{image}'
+
+
+def _storage_ref(image: str) -> str:
+    """
+    Reference an image inside benchbuild's container storage for skopeo.
+    """
+    root = os.path.abspath(str(CFG['container']['root']))
+    runroot = os.path.abspath(str(CFG['container']['runroot']))
+    return f'containers-storage:[{root}+{runroot}]{_qualified_name(image)}'
 
-    LOG.debug('created container: %s', container_id)
-    return container_id
+
+def _remove(path: str) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
 
 
 def save(image_id: str, out_path: str) -> None:
-    if local.path(out_path).exists():
-        rm(out_path)
-    bb_podman('save')('-o', out_path, image_id)
+    """
+    Export an image to a docker archive at out_path.
+
+    With skopeo available the image is copied directly out of the storage.
+    If skopeo is missing or fails, we fall back to 'podman save'. The
+    archive is written to a temporary file that replaces out_path afterwards.
+    """
+    tmp_path = out_path + '.tmp'
+    _remove(tmp_path)
+
+    if _has_skopeo():
+        archive_ref = f'docker-archive:{tmp_path}:{_qualified_name(image_id)}'
+        try:
+            skopeo('copy', _storage_ref(image_id), archive_ref)
+            os.replace(tmp_path, out_path)
+            return
+        except ProcessExecutionError:
+            LOG.debug('skopeo could not export %s', image_id)
+            _remove(tmp_path)
+
+    bb_podman('save')('-o', tmp_path, image_id)
+    os.replace(tmp_path, out_path)
 
 
 def load(image_name: str, load_path: str) -> None:
+    """
+    Import an image from the archive at load_path.
+
+    With skopeo available the archive is copied directly into the storage.
+    If skopeo is missing or fails, we fall back to 'podman load'.
+    """
+    if _has_skopeo():
+        try:
+            skopeo(
+                'copy', f'docker-archive:{load_path}', _storage_ref(image_name)
+            )
+            return
+        except ProcessExecutionError:
+            LOG.debug('skopeo could not import %s', load_path)
+
     bb_podman('load')('-i', load_path, image_name)
 
 
@@ -73,4 +193,5 @@ def run_container(name: str) -> None:
 
 def remove_container(container_id: str) -> None:
     podman_rm = bb_podman('rm')
-    podman_rm(container_id)
+    with _podman_cs_lock():
+        podman_rm(container_id)
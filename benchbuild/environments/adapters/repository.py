@@ -15,8 +15,9 @@ class AbstractRegistry(abc.ABC):
     containers: tp.Set[model.Container] = attr.ib(default=attr.Factory(set))
 
     def get_image(self, tag: str) -> model.MaybeImage:
-        if tag in self.images:
-            return self.images[tag]
+        image = self.images.get(tag)
+        if image is not None:
+            return image
 
         image = self._get_image(tag)
         if image:
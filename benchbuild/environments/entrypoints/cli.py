@@ -1,6 +1,8 @@
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import partial
 
+import rich
 from plumbum import cli, local
 
 from benchbuild import experiment, plugins, project, settings, source
@@ -44,23 +46,28 @@ class BenchBuildContainer(cli.Application):  # type: ignore
                        help='Replace existing container images.')
 
     def main(self, *projects: str) -> int:
-        plugins.discover()
-
         if self.replace:
             CFG['container']['replace'] = True
 
         cli_experiments = self.experiment_args
         cli_groups = self.group_args
 
+        if not cli_experiments:
+            print("No experiment selected. Exiting.")
+            return -2
+
+        plugins.discover()
+
         discovered_experiments = experiment.discovered()
+        wanted_names = set(cli_experiments)
         wanted_experiments = {
             name: cls
             for name, cls in discovered_experiments.items()
-            if name in set(cli_experiments)
+            if name in wanted_names
         }
         unknown_experiments = [
             name for name in cli_experiments
-            if name not in set(discovered_experiments.keys())
+            if name not in discovered_experiments
         ]
 
         if unknown_experiments:
@@ -100,7 +107,7 @@ def enumerate_projects(
 
 
 def make_version_tag(*versions: source.Variant) -> str:
-    return '-'.join([str(v) for v in versions])
+    return '-'.join(map(str, versions))
 
 
 def make_image_name(name: str, tag: str) -> str:
@@ -182,6 +189,50 @@ def __pull_sources_in_context(prj: project.Project) -> None:
 BB_APP_ROOT: str = '/app'
 
 
+def _submit_all(
+    cmds: tp.Sequence[commands.Command],
+    make_uow: tp.Callable[[], unit_of_work.AbstractUnitOfWork]
+) -> messagebus.CommandResults:
+    """
+    Dispatch all commands to the messagebus using a bounded worker pool.
+
+    Every command gets a fresh unit of work. The number of workers is
+    limited by CFG['container']['parallel_builds']. If a command fails,
+    commands that did not start yet are cancelled and the error is raised.
+
+    Args:
+        cmds: The commands to dispatch.
+        make_uow: Factory for the unit of work of a single command.
+
+    Returns:
+        The results of all commands, in order of completion.
+    """
+    results: messagebus.CommandResults = []
+    if not cmds:
+        return results
+
+    max_workers = min(len(cmds), int(CFG['container']['parallel_builds']))
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [
+            executor.submit(messagebus.handle, cmd, make_uow()) for cmd in cmds
+        ]
+        try:
+            for future in as_completed(futures):
+                results.extend(future.result())
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+    return results
+
+
+def _print_images(images: messagebus.CommandResults) -> None:
+    if images:
+        lines = ['The following images are available:']
+        lines.extend(f'   {image}' for image in images)
+        rich.print('\n'.join(lines))
+
+
 def create_project_images(
     experiments: ExperimentIndex, projects: ProjectIndex
 ) -> None:
@@ -194,11 +245,15 @@ def create_project_images(
         projects: A project index that contains all reqquested (name, project)
                   Tuples.
     """
+    # Every experiment enumerates the same projects, keep one per image tag.
+    image_commands: tp.Dict[str, commands.CreateImage] = {}
     build_dir = local.path(BB_APP_ROOT) / 'results'
 
     for prj in enumerate_projects(experiments, projects):
         version = make_version_tag(*prj.variant.values())
         image_tag = make_image_name(f'{prj.name}/{prj.group}', version)
+        if image_tag in image_commands:
+            continue
 
         layers = prj.container
         layers.context(partial(__pull_sources_in_context, prj))
@@ -211,17 +266,21 @@ def create_project_images(
         )
         layers.workingdir(BB_APP_ROOT)
 
-        cmd = commands.CreateImage(image_tag, layers)
-        uow = unit_of_work.ContainerImagesUOW()
-        messagebus.handle(cmd, uow)
+        image_commands[image_tag] = commands.CreateImage(image_tag, layers)
+
+    _print_images(
+        _submit_all(
+            list(image_commands.values()), unit_of_work.ContainerImagesUOW
+        )
+    )
 
 
 def enumerate_experiments(
     experiments: ExperimentIndex, projects: ProjectIndex
 ) -> tp.Generator[experiment.Experiment, None, None]:
+    prjs = list(enumerate_projects(experiments, projects))
     for exp_class in experiments.values():
-        prjs = list(enumerate_projects(experiments, projects))
-        yield exp_class(projects=prjs)
+        yield exp_class(projects=list(prjs))
 
 
 def create_experiment_images(
@@ -243,6 +302,9 @@ def create_experiment_images(
         projects: A project index that contains all reqquested (name, project)
                   Tuples.
     """
+    image_commands: tp.Dict[str, commands.CreateImage] = {}
+    verbosity = int(settings.CFG['verbosity'])
+
     for exp in enumerate_experiments(experiments, projects):
         for prj in exp.projects:
             version = make_version_tag(*prj.variant.values())
@@ -250,19 +312,23 @@ def create_experiment_images(
             image_tag = make_image_name(
                 f'{exp.name}/{prj.name}/{prj.group}', version
             )
+            if image_tag in image_commands:
+                continue
 
             image = declarative.ContainerImage().from_(base_tag)
             image.extend(exp.container)
             image.env(BB_PLUGINS_EXPERIMENTS=f'["{exp.__module__}"]')
-            verbosity = int(settings.CFG['verbosity'])
             image.env(BB_VERBOSITY=f'{verbosity}')
 
             image.entrypoint('benchbuild', 'run', '-E', exp.name, str(prj.id))
 
-            cmd = commands.CreateImage(image_tag, image)
-            uow = unit_of_work.ContainerImagesUOW()
+            image_commands[image_tag] = commands.CreateImage(image_tag, image)
 
-            messagebus.handle(cmd, uow)
+    _print_images(
+        _submit_all(
+            list(image_commands.values()), unit_of_work.ContainerImagesUOW
+        )
+    )
 
 
 def run_experiment_images(
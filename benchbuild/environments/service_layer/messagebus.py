@@ -13,11 +13,13 @@ Messages = tp.List[Message]
 EventHandlerT = tp.Callable[[events.Event, unit_of_work.AbstractUnitOfWork],
                             None]
 CommandHandlerT = tp.Callable[
-    [commands.Command, unit_of_work.AbstractUnitOfWork], str]
+    [commands.Command, unit_of_work.AbstractUnitOfWork], tp.Optional[str]]
 CommandResults = tp.List[str]
 
 
-def handle(message: Message, uow: unit_of_work.AbstractUnitOfWork) -> None:
+def handle(
+    message: Message, uow: unit_of_work.AbstractUnitOfWork
+) -> CommandResults:
     """
     Distribute the given message to the required handlers.
 
@@ -28,15 +30,19 @@ def handle(message: Message, uow: unit_of_work.AbstractUnitOfWork) -> None:
     Returns:
         CommandResults
     """
+    results: CommandResults = []
     queue = [message]
     while queue:
         message = queue.pop(0)
         if isinstance(message, events.Event):
             handle_event(message, queue, uow)
         elif isinstance(message, commands.Command):
-            handle_command(message, queue, uow)
+            result = handle_command(message, queue, uow)
+            if result:
+                results.append(result)
         else:
             raise Exception(f'{message} was not an Event or Command')
+    return results
 
 
 def handle_event(
@@ -64,7 +70,7 @@ def handle_event(
 def handle_command(
     command: commands.Command, queue: Messages,
     uow: unit_of_work.AbstractUnitOfWork
-) -> None:
+) -> tp.Optional[str]:
     """
     Invokes a registered command handler.
 
@@ -75,13 +81,14 @@ def handle_command(
         uow: The unit of work to handle this command.
 
     Returns:
-        str
+        The handler's result, if it produces one.
     """
     LOG.debug('handling command %s', command)
     try:
         handler = tp.cast(CommandHandlerT, COMMAND_HANDLERS[type(command)])
-        handler(command, uow)
+        result = handler(command, uow)
         queue.extend(uow.collect_new_events())
+        return result
     except Exception:
         LOG.exception('Exception handling command %s', command)
         raise
@@ -1,3 +1,5 @@
+import typing as tp
+
 from plumbum import local
 
 import benchbuild as bb
@@ -33,35 +35,10 @@ class BOTSGroup(bb.Project):
             refspec='HEAD')
     ]
 
-    path_dict = {
-        "alignment": "serial/alignment",
-        "fft": "serial/fft",
-        "fib": "serial/fib",
-        "floorplan": "serial/floorplan",
-        "health": "serial/health",
-        "knapsack": "serial/knapsack",
-        "nqueens": "serial/nqueens",
-        "sort": "serial/sort",
-        "sparselu": "serial/sparselu",
-        "strassen": "serial/strassen",
-        "uts": "serial/uts"
-    }
-
-    input_dict = {
-        "alignment": ["prot.100.aa", "prot.20.aa"],
-        "floorplan": ["input.15", "input.20", "input.5"],
-        "health": ["large.input", "medium.input", "small.input", "test.input"],
-        "knapsack": [
-            "knapsack-012.input", "knapsack-016.input", "knapsack-020.input",
-            "knapsack-024.input", "knapsack-032.input", "knapsack-036.input",
-            "knapsack-040.input", "knapsack-044.input", "knapsack-048.input",
-            "knapsack-064.input", "knapsack-096.input", "knapsack-128.input"
-        ],
-        "uts": [
-            "huge.input", "large.input", "medium.input", "small.input",
-            "test.input", "tiny.input"
-        ]
-    }
+    # Subdirectory of the benchmark's sources inside the repository.
+    PATH = ''
+    # Input files of the benchmark, relative to inputs/<name>.
+    INPUTS: tp.Tuple[str, ...] = ()
 
     def compile(self):
         bots_repo = local.path(self.source_of('bots.git'))
@@ -88,12 +65,12 @@ class BOTSGroup(bb.Project):
                 "OMPLINK_FLAGS=",
                 "OMPSSLINK_FLAGS=",
             ]
-            lines = [l.format(cc=clang) + "\n" for l in lines]
-            config.writelines(lines)
+            cc = str(clang)
+            config.write("\n".join(l.format(cc=cc) for l in lines) + "\n")
         mkdir(bots_repo / "bin")
         with local.cwd(bots_repo):
             _make = bb.watch(make)
-            _make("-C", self.path_dict[self.name])
+            _make("-C", self.PATH)
 
     def run_tests(self):
         binary_name = "{name}.benchbuild.serial".format(name=self.name)
@@ -102,53 +79,77 @@ class BOTSGroup(bb.Project):
         exp = bb.wrap(binary_path, self)
         _exp = bb.watch(exp)
 
-        if self.name in self.input_dict:
-            for test_input in self.input_dict[self.name]:
-                input_file = bots_repo / "inputs" / self.name / test_input
-                _exp("-f", input_file)
+        if self.INPUTS:
+            input_root = bots_repo / "inputs" / self.name
+            for test_input in self.INPUTS:
+                _exp("-f", input_root / test_input)
         else:
             _exp()
 
 
 class Alignment(BOTSGroup):
     NAME = 'alignment'
+    PATH = 'serial/alignment'
+    INPUTS = ("prot.100.aa", "prot.20.aa")
 
 
 class FFT(BOTSGroup):
     NAME = 'fft'
+    PATH = 'serial/fft'
 
 
 class Fib(BOTSGroup):
     NAME = 'fib'
+    PATH = 'serial/fib'
 
 
 class FloorPlan(BOTSGroup):
     NAME = 'floorplan'
+    PATH = 'serial/floorplan'
+    INPUTS = ("input.15", "input.20", "input.5")
 
 
 class Health(BOTSGroup):
     NAME = 'health'
+    PATH = 'serial/health'
+    INPUTS = ("large.input", "medium.input", "small.input", "test.input")
 
 
 class Knapsack(BOTSGroup):
     NAME = 'knapsack'
+    PATH = 'serial/knapsack'
+    INPUTS = (
+        "knapsack-012.input", "knapsack-016.input", "knapsack-020.input",
+        "knapsack-024.input", "knapsack-032.input", "knapsack-036.input",
+        "knapsack-040.input", "knapsack-044.input", "knapsack-048.input",
+        "knapsack-064.input", "knapsack-096.input", "knapsack-128.input"
+    )
 
 
 class NQueens(BOTSGroup):
     NAME = 'nqueens'
+    PATH = 'serial/nqueens'
 
 
 class Sort(BOTSGroup):
     NAME = 'sort'
+    PATH = 'serial/sort'
 
 
 class SparseLU(BOTSGroup):
     NAME = 'sparselu'
+    PATH = 'serial/sparselu'
 
 
 class Strassen(BOTSGroup):
     NAME = 'strassen'
+    PATH = 'serial/strassen'
 
 
 class UTS(BOTSGroup):
     NAME = 'uts'
+    PATH = 'serial/uts'
+    INPUTS = (
+        "huge.input", "large.input", "medium.input", "small.input",
+        "test.input", "tiny.input"
+    )
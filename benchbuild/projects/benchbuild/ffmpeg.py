@@ -4,7 +4,8 @@ import benchbuild as bb
 from benchbuild.environments.domain.declarative import ContainerImage
 from benchbuild.settings import CFG
 from benchbuild.source import HTTP
-from benchbuild.utils.cmd import make, tar
+from benchbuild.utils.archive import untar
+from benchbuild.utils.cmd import make
 from benchbuild.utils.settings import get_number_of_jobs
 
 
@@ -36,7 +37,7 @@ class LibAV(bb.Project):
     def compile(self):
         ffmpeg_source = local.path(self.source_of('ffmpeg.tar.bz2'))
         ffmpeg_version = self.version_of('ffmpeg.tar.bz2')
-        tar('xfj', ffmpeg_source)
+        untar(ffmpeg_source, 'j')
         unpack_dir = local.path(f'ffmpeg-{ffmpeg_version}')
         clang = bb.compiler.cc(self)
 
@@ -6,7 +6,8 @@ import benchbuild as bb
 from benchbuild.environments.domain.declarative import ContainerImage
 from benchbuild.settings import CFG
 from benchbuild.source import Git
-from benchbuild.utils.cmd import make, mkdir, tar
+from benchbuild.utils.archive import untar
+from benchbuild.utils.cmd import make, mkdir
 from benchbuild.utils.settings import get_number_of_jobs
 
 
@@ -46,7 +47,7 @@ class SpiderMonkey(bb.Project):
 
         mozjs_dir = local.path("mozjs-0.0.0")
         mozjs_src_dir = mozjs_dir / "js" / "src"
-        tar("xfj", mozjs_dir + ".tar.bz2")
+        untar(mozjs_dir + ".tar.bz2", "j")
         with local.cwd(mozjs_src_dir):
             mkdir("obj")
             autoconf = local["autoconf-2.13"]
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from plumbum import local
 
@@ -6,7 +7,8 @@ import benchbuild as bb
 from benchbuild.environments.domain.declarative import ContainerImage
 from benchbuild.settings import CFG
 from benchbuild.source import HTTP, Git
-from benchbuild.utils.cmd import make, tar
+from benchbuild.utils.archive import untar
+from benchbuild.utils.cmd import make
 from benchbuild.utils.settings import get_number_of_jobs
 
 
@@ -52,37 +54,54 @@ class Lapack(bb.Project):
         clapack_source = local.path(self.source_of('clapack.tgz'))
         clapack_version = self.version_of('clapack.tgz')
 
-        tar("xfz", clapack_source)
+        untar(clapack_source, 'z')
         unpack_dir = "CLAPACK-{0}".format(clapack_version)
 
         clang = bb.compiler.cc(self)
         clang_cxx = bb.compiler.cxx(self)
         with local.cwd(unpack_dir):
             with open("make.inc", 'w') as makefile:
-                content = [
-                    "SHELL     = /bin/sh\n", "PLAT      = _LINUX\n",
-                    "CC        = " + str(clang) + "\n", "CXX       = " +
-                    str(clang_cxx) + "\n", "CFLAGS    = -I$(TOPDIR)/INCLUDE\n",
-                    "LOADER    = " + str(clang) + "\n", "LOADOPTS  = \n",
-                    "NOOPT     = -O0 -I$(TOPDIR)/INCLUDE\n",
-                    "DRVCFLAGS = $(CFLAGS)\n", "F2CCFLAGS = $(CFLAGS)\n",
-                    "TIMER     = INT_CPU_TIME\n", "ARCH      = ar\n",
-                    "ARCHFLAGS = cr\n", "RANLIB    = ranlib\n",
-                    "BLASLIB   = ../../blas$(PLAT).a\n", "XBLASLIB  = \n",
-                    "LAPACKLIB = lapack$(PLAT).a\n",
-                    "F2CLIB    = ../../F2CLIBS/libf2c.a\n",
-                    "TMGLIB    = tmglib$(PLAT).a\n",
-                    "EIGSRCLIB = eigsrc$(PLAT).a\n",
-                    "LINSRCLIB = linsrc$(PLAT).a\n",
+                makefile.write(
+                    "SHELL     = /bin/sh\n"
+                    "PLAT      = _LINUX\n"
+                    f"CC        = {clang}\n"
+                    f"CXX       = {clang_cxx}\n"
+                    "CFLAGS    = -I$(TOPDIR)/INCLUDE\n"
+                    f"LOADER    = {clang}\n"
+                    "LOADOPTS  = \n"
+                    "NOOPT     = -O0 -I$(TOPDIR)/INCLUDE\n"
+                    "DRVCFLAGS = $(CFLAGS)\n"
+                    "F2CCFLAGS = $(CFLAGS)\n"
+                    "TIMER     = INT_CPU_TIME\n"
+                    "ARCH      = ar\n"
+                    "ARCHFLAGS = cr\n"
+                    "RANLIB    = ranlib\n"
+                    "BLASLIB   = ../../blas$(PLAT).a\n"
+                    "XBLASLIB  = \n"
+                    "LAPACKLIB = lapack$(PLAT).a\n"
                     "F2CLIB    = ../../F2CLIBS/libf2c.a\n"
-                ]
-                makefile.writelines(content)
+                    "TMGLIB    = tmglib$(PLAT).a\n"
+                    "EIGSRCLIB = eigsrc$(PLAT).a\n"
+                    "LINSRCLIB = linsrc$(PLAT).a\n"
+                    "F2CLIB    = ../../F2CLIBS/libf2c.a\n"
+                )
 
+            jobs = get_number_of_jobs(CFG)
             _make = bb.watch(make)
-            _make("-j", get_number_of_jobs(CFG), "f2clib", "blaslib")
+            _make("-j", jobs, "f2clib", "blaslib")
+
+            # Both test makefiles are independent, build them side by side,
+            # unless we may only use a single job.
+            test_builds = 2 if jobs >= 2 else 1
+            test_jobs = max(1, jobs // test_builds)
             with local.cwd(local.path("BLAS") / "TESTING"):
-                _make("-j", get_number_of_jobs(CFG), "-f", "Makeblat2")
-                _make("-j", get_number_of_jobs(CFG), "-f", "Makeblat3")
+                with ThreadPoolExecutor(max_workers=test_builds) as executor:
+                    futures = [
+                        executor.submit(_make, "-j", test_jobs, "-f", makefile)
+                        for makefile in ["Makeblat2", "Makeblat3"]
+                    ]
+                    for future in futures:
+                        future.result()
 
     def run_tests(self):
         clapack_version = self.version_of('clapack.tgz')
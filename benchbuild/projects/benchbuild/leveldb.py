@@ -4,8 +4,10 @@ from plumbum import local
 
 import benchbuild as bb
 from benchbuild.environments.domain.declarative import ContainerImage
+from benchbuild.settings import CFG
 from benchbuild.source import Git
 from benchbuild.utils.cmd import make
+from benchbuild.utils.settings import get_number_of_jobs
 
 
 class LevelDB(bb.Project):
@@ -31,8 +33,10 @@ class LevelDB(bb.Project):
         with local.cwd(leveldb_repo):
             with local.env(CXX=str(clang_cxx), CC=str(clang)):
                 _make = bb.watch(make)
-                _make("clean")
-                _make("all", "-i")
+                if any((leveldb_repo / out).exists()
+                       for out in ["out-static", "out-shared"]):
+                    _make("clean")
+                _make("-j", get_number_of_jobs(CFG), "all", "-i")
 
     def run_tests(self):
         """
@@ -1,8 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from plumbum import local
 
 import benchbuild as bb
 from benchbuild.environments.domain.declarative import ContainerImage
+from benchbuild.settings import CFG
 from benchbuild.source import Git
+from benchbuild.utils.settings import get_number_of_jobs
+
+
+def _compile_objects(clang, src_files):
+    """
+    Compile all translation units in parallel, one object file each.
+
+    Returns:
+        The object files, in the order of src_files.
+    """
+    obj_files = [src_file + '.o' for src_file in src_files]
+    with ThreadPoolExecutor(max_workers=get_number_of_jobs(CFG)) as executor:
+        futures = [
+            executor.submit(clang, "-c", "-o", obj_file, src_file)
+            for src_file, obj_file in zip(src_files, obj_files)
+        ]
+        for future in futures:
+            future.result()
+    return obj_files
 
 
 class Lulesh(bb.Project):
@@ -28,11 +50,7 @@ class Lulesh(bb.Project):
         cxx_files = local.cwd / lulesh_repo // "*.cc"
         clang = bb.compiler.cxx(self)
         with local.cwd(lulesh_repo):
-            for src_file in cxx_files:
-                clang("-c", "-o", src_file + '.o', src_file)
-
-        obj_files = local.cwd / lulesh_repo // "*.cc.o"
-        with local.cwd(lulesh_repo):
+            obj_files = _compile_objects(clang, cxx_files)
             clang(obj_files, "-lm", "-o", "../lulesh")
 
     def run_tests(self):
@@ -66,11 +84,7 @@ class LuleshOMP(bb.Project):
         cxx_files = local.cwd / lulesh_repo // "*.cc"
         clang = bb.compiler.cxx(self)
         with local.cwd(lulesh_repo):
-            for src_file in cxx_files:
-                clang("-c", "-o", src_file + '.o', src_file)
-
-        obj_files = local.cwd / lulesh_repo // "*.cc.o"
-        with local.cwd(lulesh_repo):
+            obj_files = _compile_objects(clang, cxx_files)
             clang(obj_files, "-lm", "-o", "../lulesh")
 
     def run_tests(self):
@@ -2,8 +2,10 @@ from plumbum import local
 
 import benchbuild as bb
 from benchbuild.environments.domain.declarative import ContainerImage
+from benchbuild.settings import CFG
 from benchbuild.source import HTTP, Git
 from benchbuild.utils.cmd import make, tar
+from benchbuild.utils.settings import get_number_of_jobs
 
 
 class Minisat(bb.Project):
@@ -42,10 +44,9 @@ class Minisat(bb.Project):
         testfiles = test_dir // "*.cnf.gz"
 
         minisat = bb.wrap(minisat_bin / "minisat", self)
+        minisat = minisat.with_env(LD_LIBRARY_PATH=minisat_lib)
         for test_f in testfiles:
-            _minisat = bb.watch(
-                (minisat.with_env(LD_LIBRARY_PATH=minisat_lib) < test_f)
-            )
+            _minisat = bb.watch(minisat < test_f)
             _minisat()
 
     def compile(self):
@@ -57,7 +58,6 @@ class Minisat(bb.Project):
             clang = bb.compiler.cc(self)
             clang_cxx = bb.compiler.cxx(self)
 
-            _make(
-                "CC=" + str(clang), "CXX=" + str(clang_cxx), "clean", "lsh",
-                "sh"
-            )
+            compilers = ("CC=" + str(clang), "CXX=" + str(clang_cxx))
+            _make(*compilers, "clean")
+            _make("-j", get_number_of_jobs(CFG), *compilers, "lsh", "sh")
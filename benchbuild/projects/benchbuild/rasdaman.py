@@ -41,12 +41,13 @@ class Rasdaman(bb.Project):
 
         clang = bb.compiler.cc(self)
         clang_cxx = bb.compiler.cxx(self)
+        compiler_env = {'CC': str(clang), 'CXX': str(clang_cxx)}
 
         with local.cwd(gdal_repo):
             configure = local["./configure"]
             _configure = bb.watch(configure)
 
-            with local.env(CC=str(clang), CXX=str(clang_cxx)):
+            with local.env(**compiler_env):
                 _configure(
                     "--with-pic", "--enable-static", "--with-gnu-ld",
                     "--without-ld-shared", "--without-libtool"
@@ -59,7 +60,7 @@ class Rasdaman(bb.Project):
             configure = local["./configure"]
             _configure = bb.watch(configure)
 
-            with local.env(CC=str(clang), CXX=str(clang_cxx)):
+            with local.env(**compiler_env):
                 _configure(
                     "--without-debug-symbols", "--with-static-libs",
                     "--disable-java", "--with-pic", "--disable-debug",
@@ -3,7 +3,8 @@ from plumbum import local
 import benchbuild as bb
 from benchbuild.environments.domain.declarative import ContainerImage
 from benchbuild.source import HTTP
-from benchbuild.utils.cmd import cp, make, tar
+from benchbuild.utils.archive import untar
+from benchbuild.utils.cmd import cp, make
 
 
 class SevenZip(bb.Project):
@@ -28,7 +29,7 @@ class SevenZip(bb.Project):
         sevenzip_source = local.path(self.source_of('p7zip.tar.bz2'))
         sevenzip_version = self.version_of('p7zip.tar.bz2')
         unpack_dir = local.path(f'p7zip_{sevenzip_version}')
-        tar('xfj', sevenzip_source)
+        untar(sevenzip_source, 'j')
 
         cp(
             unpack_dir / "makefile.linux_clang_amd64_asm",
@@ -40,7 +41,9 @@ class SevenZip(bb.Project):
 
         with local.cwd(unpack_dir):
             _make = bb.watch(make)
-            _make("CC=" + str(clang), "CXX=" + str(clang_cxx), "clean", "all")
+            if (unpack_dir / "bin").exists():
+                _make("clean")
+            _make("CC=" + str(clang), "CXX=" + str(clang_cxx), "all")
 
     def run_tests(self):
         sevenzip_version = self.version_of('p7zip.tar.bz2')
@@ -342,6 +342,16 @@ CFG["container"] = {
         "default": "/usr/bin/crun",
         "desc": "Default container runtime used by podman"
     },
+    "transient_store": {
+        "default": False,
+        "desc":
+            "Keep podman's container database in the runroot. "
+            "Requires podman 4.4 or newer."
+    },
+    "parallel_builds": {
+        "default": 1,
+        "desc": "Number of container images that will be built in parallel."
+    },
     "source": {
         "default": s.ConfigPath(os.getcwd()),
         "desc": "Path to benchbuild's source directory"
@@ -0,0 +1,47 @@
+"""Helpers to unpack source archives."""
+import functools
+import typing as tp
+
+from benchbuild import utils
+from benchbuild.utils import cmd
+from benchbuild.utils.cmd import tar
+
+# Parallel drop-in replacements for tar's decompressors, in order of
+# preference. Keyed by tar's compression flag.
+PARALLEL_DECOMPRESSORS = {'j': ['lbzip2', 'pbzip2'], 'z': ['pigz']}
+
+
+@functools.lru_cache(maxsize=None)
+def parallel_decompressor(compression: str) -> tp.Optional[str]:
+    """
+    Find a parallel decompressor for tar's compression flag.
+
+    Args:
+        compression: tar's compression flag, e.g., 'j' for bzip2.
+
+    Returns:
+        The name of the first decompressor that is available, None otherwise.
+    """
+    for name in PARALLEL_DECOMPRESSORS.get(compression, []):
+        if not isinstance(getattr(cmd, name), utils.ErrorCommand):
+            return name
+    return None
+
+
+def untar(archive: str, compression: str = '') -> None:
+    """
+    Extract a tar archive into the current working directory.
+
+    Uses a parallel decompressor, if one is available for the archive's
+    compression. Falls back to tar's builtin decompression otherwise.
+
+    Args:
+        archive: The archive to extract.
+        compression: tar's compression flag for the archive, e.g., 'j' for
+            bzip2 or 'z' for gzip.
+    """
+    decompressor = parallel_decompressor(compression)
+    if decompressor:
+        tar('-I', decompressor, '-xf', archive)
+    else:
+        tar('xf' + compression, archive)
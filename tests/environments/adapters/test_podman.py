@@ -0,0 +1,184 @@
+"""
+Test the podman adapter.
+"""
+import os
+import typing as tp
+
+import pytest
+from plumbum import ProcessExecutionError
+
+from benchbuild.environments.adapters import podman
+
+
+def test_cfg_mount_args_follow_configuration_changes():
+    mounts = podman.CFG['container']['mounts'].value
+
+    try:
+        podman.CFG['container']['mounts'] = [['/a', '/b']]
+        assert podman._cfg_mount_args() == ('type=bind,src=/a,target=/b',)
+
+        podman.CFG['container']['mounts'] = []
+        assert podman._cfg_mount_args() == ()
+    finally:
+        podman.CFG['container']['mounts'] = mounts
+
+
+@pytest.fixture
+def podman_args(monkeypatch) -> tp.List[tp.Tuple[str, ...]]:
+    calls: tp.List[tp.Tuple[str, ...]] = []
+
+    def fake_bb_podman(*args: str) -> tp.Callable[[], str]:
+        calls.append(args)
+        return lambda: 'container-id\n'
+
+    monkeypatch.setattr(podman, 'bb_podman', fake_bb_podman)
+    monkeypatch.setattr(podman, '_cfg_mount_args', lambda: ())
+    return calls
+
+
+@pytest.mark.parametrize('mounts', [None, []])
+def test_create_container_without_mounts(podman_args, mounts):
+    container_id = podman.create_container('image', 'name', mounts)
+
+    assert container_id == 'container-id'
+    assert podman_args == [('create', '--replace', '--name', 'name', 'image')]
+
+
+def test_create_container_keeps_all_mounts(podman_args):
+    podman.create_container('image', 'name', ['a', 'b'])
+
+    assert podman_args == [(
+        'create', '--replace', '--mount', 'a', '--mount', 'b', '--name', 'name',
+        'image'
+    )]
+
+
+def test_create_container_returns_new_id_after_replace(monkeypatch):
+    monkeypatch.setattr(
+        podman, 'bb_podman', lambda *args: lambda: 'old-id\nnew-id\n'
+    )
+    monkeypatch.setattr(podman, '_cfg_mount_args', lambda: ())
+
+    assert podman.create_container('image', 'name') == 'new-id'
+
+
+def test_podman_lock_without_transient_store(monkeypatch, tmp_path):
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    transient_store = podman.CFG['container']['transient_store'].value
+    podman.CFG['container']['transient_store'] = False
+
+    try:
+        with podman._podman_cs_lock():
+            assert (tmp_path / 'benchbuild-podman.lock').exists()
+    finally:
+        podman.CFG['container']['transient_store'] = transient_store
+
+
+def test_podman_lock_is_per_user_without_runtime_dir(monkeypatch):
+    monkeypatch.delenv('XDG_RUNTIME_DIR', raising=False)
+    transient_store = podman.CFG['container']['transient_store'].value
+    podman.CFG['container']['transient_store'] = False
+
+    try:
+        with podman._podman_cs_lock():
+            assert os.path.exists(f'/tmp/benchbuild-podman-{os.getuid()}.lock')
+    finally:
+        podman.CFG['container']['transient_store'] = transient_store
+
+
+@pytest.fixture
+def archive_tools(monkeypatch, tmp_path):
+    """
+    Record skopeo/podman calls. Both write the archive they are asked for.
+    """
+    calls: tp.Dict[str, tp.Any] = {'skopeo': [], 'podman': [], 'fail': False}
+
+    def fake_skopeo(*args: str) -> None:
+        calls['skopeo'].append(args)
+        if calls['fail']:
+            raise ProcessExecutionError(['skopeo', *args], 1, '', 'failed')
+        _, _, dst = args
+        if dst.startswith('docker-archive:'):
+            (tmp_path / dst.split(':')[1]).write_text('skopeo')
+
+    def fake_bb_podman(*args: str) -> tp.Callable[..., None]:
+
+        def run(*cmd_args: str) -> None:
+            calls['podman'].append(args + cmd_args)
+            if args == ('save',):
+                (tmp_path / cmd_args[1]).write_text('podman')
+
+        return run
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(podman, 'skopeo', fake_skopeo)
+    monkeypatch.setattr(podman, '_has_skopeo', lambda: True)
+    monkeypatch.setattr(podman, 'bb_podman', fake_bb_podman)
+    return calls
+
+
+@pytest.mark.parametrize(
+    'name, qualified', [
+        ('benchbuild:alpine', 'localhost/benchbuild:alpine'),
+        ('prj/grp:1', 'localhost/prj/grp:1'),
+        ('localhost/prj/grp:1', 'localhost/prj/grp:1'),
+        ('docker.io/library/alpine:3', 'docker.io/library/alpine:3'),
+        ('registry:5000/alpine:3', 'registry:5000/alpine:3'),
+    ]
+)
+def test_qualified_name(name, qualified):
+    assert podman._qualified_name(name) == qualified
+
+
+def test_save_with_skopeo(archive_tools, tmp_path):
+    podman.save('benchbuild:alpine', 'out.tar')
+
+    assert len(archive_tools['skopeo']) == 1
+    _, src, dst = archive_tools['skopeo'][0]
+    assert src.endswith(']localhost/benchbuild:alpine')
+    assert dst == 'docker-archive:out.tar.tmp:localhost/benchbuild:alpine'
+    assert not archive_tools['podman']
+    assert (tmp_path / 'out.tar').read_text() == 'skopeo'
+    assert not (tmp_path / 'out.tar.tmp').exists()
+
+
+def test_save_falls_back_to_podman(archive_tools, tmp_path):
+    archive_tools['fail'] = True
+    (tmp_path / 'out.tar').write_text('old')
+
+    podman.save('benchbuild:alpine', 'out.tar')
+
+    assert archive_tools['skopeo']
+    assert archive_tools['podman'] == [
+        ('save', '-o', 'out.tar.tmp', 'benchbuild:alpine')
+    ]
+    assert (tmp_path / 'out.tar').read_text() == 'podman'
+
+
+def test_save_without_skopeo(archive_tools, monkeypatch, tmp_path):
+    monkeypatch.setattr(podman, '_has_skopeo', lambda: False)
+
+    podman.save('benchbuild:alpine', 'out.tar')
+
+    assert not archive_tools['skopeo']
+    assert (tmp_path / 'out.tar').read_text() == 'podman'
+
+
+def test_load_with_skopeo(archive_tools):
+    podman.load('benchbuild:alpine', 'in.tar')
+
+    assert len(archive_tools['skopeo']) == 1
+    _, src, dst = archive_tools['skopeo'][0]
+    assert src == 'docker-archive:in.tar'
+    assert dst.endswith(']localhost/benchbuild:alpine')
+    assert not archive_tools['podman']
+
+
+def test_load_falls_back_to_podman(archive_tools):
+    archive_tools['fail'] = True
+
+    podman.load('benchbuild:alpine', 'in.tar')
+
+    assert archive_tools['podman'] == [
+        ('load', '-i', 'in.tar', 'benchbuild:alpine')
+    ]
@@ -1,8 +1,12 @@
 """
 Test declarative API
 """
+import time
+
+import pytest
+
 from benchbuild.environments.entrypoints import cli
-from benchbuild.experiments.empty import Empty
+from benchbuild.experiments.empty import Empty, NoMeasurement
 from tests.project.test_project import DummyPrj, DummyPrjNoContainerImage
 
 
@@ -15,3 +19,90 @@ def test_cli_enumerates_only_supported_projects():
     prjs = list(cli.enumerate_projects(exp_index, prj_index))
 
     assert len(prjs) == 1
+
+
+def test_cli_submits_every_command_with_own_uow(monkeypatch):
+    handled = []
+
+    def fake_handle(cmd, uow):
+        handled.append((cmd, uow))
+        return [cmd]
+
+    monkeypatch.setattr(cli.messagebus, 'handle', fake_handle)
+
+    cmds = ['a', 'b', 'c']
+    results = cli._submit_all(cmds, object)
+
+    assert sorted(results) == cmds
+    assert sorted(cmd for cmd, _ in handled) == cmds
+    assert len({id(uow) for _, uow in handled}) == len(cmds)
+
+
+def test_cli_stops_submitted_commands_after_a_failure(monkeypatch):
+    handled = []
+
+    def fake_handle(cmd, uow):
+        handled.append(cmd)
+        if cmd == 'a':
+            raise ValueError(cmd)
+        # The single worker may pick up the next command before the failure
+        # is seen. Keep it busy until the remaining ones are cancelled.
+        time.sleep(0.1)
+        return [cmd]
+
+    monkeypatch.setattr(cli.messagebus, 'handle', fake_handle)
+
+    with pytest.raises(ValueError):
+        cli._submit_all(['a', 'b', 'c', 'd'], object)
+
+    assert handled[0] == 'a'
+    assert 'c' not in handled
+    assert 'd' not in handled
+
+
+def test_cli_enumerates_projects_once_for_all_experiments(monkeypatch):
+    calls = []
+
+    def fake_enumerate_projects(experiments, projects):
+        calls.append((experiments, projects))
+        return iter(['prj'])
+
+    monkeypatch.setattr(cli, 'enumerate_projects', fake_enumerate_projects)
+
+    exp_index = {'empty': Empty, 'empty-2': Empty}
+    exps = list(cli.enumerate_experiments(exp_index, {}))
+
+    assert len(calls) == 1
+    assert [exp.projects for exp in exps] == [['prj'], ['prj']]
+
+
+def test_cli_skips_plugin_discovery_without_experiments(monkeypatch):
+    discovered = []
+    monkeypatch.setattr(
+        cli.plugins, 'discover', lambda: discovered.append(True)
+    )
+
+    app = cli.BenchBuildContainer('benchbuild-container')
+
+    assert app.main() == -2
+    assert not discovered
+
+
+def test_cli_submits_each_image_once_for_many_experiments(monkeypatch):
+    submitted = []
+
+    def fake_submit_all(cmds, make_uow):
+        submitted.append([cmd.name for cmd in cmds])
+        return []
+
+    monkeypatch.setattr(cli, '_submit_all', fake_submit_all)
+
+    prj_index = {'TestPrj/TestGrp': DummyPrj}
+    exp_index = {'empty': Empty, 'no-measurement': NoMeasurement}
+    cli.create_project_images(exp_index, prj_index)
+    cli.create_experiment_images(exp_index, prj_index)
+
+    project_images, experiment_images = submitted
+    assert len(project_images) == 1
+    assert len(experiment_images) == 2
+    assert len(set(experiment_images)) == 2
@@ -0,0 +1,28 @@
+"""
+Test unpacking of source archives.
+"""
+import tarfile
+
+from plumbum import local
+
+from benchbuild.utils import archive
+
+
+def test_no_decompressor_for_unknown_compression():
+    assert archive.parallel_decompressor('') is None
+    assert archive.parallel_decompressor('unknown') is None
+
+
+def test_untar_extracts_gzip_archive(tmp_path):
+    content = tmp_path / 'content.txt'
+    content.write_text('benchbuild')
+    archive_path = tmp_path / 'archive.tar.gz'
+    with tarfile.open(str(archive_path), 'w:gz') as tar_file:
+        tar_file.add(str(content), arcname='content.txt')
+
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+    with local.cwd(str(out_dir)):
+        archive.untar(str(archive_path), 'z')
+
+    assert (out_dir / 'content.txt').read_text() == 'benchbuild'